@@ -1,4 +1,4 @@
-# Copyright 2014 - 2024 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -10,20 +10,18 @@
 Provides functions and classes for loading plugins
 """
 
+from functools import partial
 import importlib
-from inspect import ismodule
+from inspect import getmodulename, ismodule
+import logging
 import os
-import pkgutil
 import sys
-import traceback
 import warnings
 
-from pkg_resources import iter_entry_points, EntryPoint
-
 from pluginlib.exceptions import PluginImportError, EntryPointWarning
 from pluginlib._objects import BlacklistEntry
-from pluginlib._parent import get_plugins
-from pluginlib._util import BASESTRING, LOGGER, NoneType, PY2, raise_with_traceback
+from pluginlib._parent import get_plugins, get_plugins_generation
+from pluginlib._util import BASESTRING, LOGGER, NoneType, PY2, raise_with_traceback, scandir
 
 try:
     from collections.abc import Iterable
@@ -31,33 +29,61 @@ except ImportError:   # pragma: no cover
     # For Python < 3.3
     from collections import Iterable  # pylint: disable=deprecated-class
 
+try:
+    from importlib.util import find_spec, module_from_spec, spec_from_file_location
+except ImportError:   # pragma: no cover
+    # For Python 2
+    find_spec = module_from_spec = spec_from_file_location = None
 
-def format_exception(etype, value, tback, limit=None):
-    """
-    Python 2 compatible version of traceback.format_exception
-    Accepts negative limits like the Python 3 version
-    """
 
-    rtn = ['Traceback (most recent call last):\n']
+# Common argument types, checked before slower abstract base class checks
+_NONE_OR_ITERABLE = (NoneType, list, tuple, set, frozenset)
+_NONE_OR_STRING = (NoneType, BASESTRING)
 
-    if limit is None or limit >= 0:
-        rtn.extend(traceback.format_tb(tback, limit))
-    else:
-        rtn.extend(traceback.format_list(traceback.extract_tb(tback)[limit:]))
+# Path of this file up to the extension, used to find loader frames in tracebacks
+_THIS_FILE_PREFIX = os.path.splitext(__file__)[0] + '.'
 
-    rtn.extend(traceback.format_exception_only(etype, value))
+# All installed entry points and entry points by group, populated on first use
+_ALL_ENTRY_POINTS = None
+_ENTRY_POINTS = {}
 
-    return rtn
+# Error messages for entry points that failed to import, keyed by entry point value
+_FAILED_ENTRY_POINTS = {}
 
+# Modules found in package paths, keyed by path and prefix
+_PACKAGE_MODULES = {}
 
-def _raise_friendly_exception(exc, name, path):
+# Maximum number of filtered results cached by each loader
+_PLUGIN_CACHE_SIZE = 256
+
+
+def _is_iterable(arg):
     """
-    Attempt to create a friendly traceback that only shows the errors
-    encountered from the plugin import and no the framework
+    Args:
+        arg: Argument to check
+
+    Returns:
+        bool: True if arg is :py:data:`None` or a non-string iterable
     """
 
-    etype = exc.__class__
-    tback = getattr(exc, '__traceback__', sys.exc_info()[2])
+    if isinstance(arg, _NONE_OR_ITERABLE):
+        return True
+
+    return isinstance(arg, Iterable) and not isinstance(arg, BASESTRING)
+
+
+def _format_friendly(exc, tback, path):
+    """
+    Args:
+        exc(Exception): Exception raised during import
+        tback(traceback): Traceback for the exception
+        path(str): Module directory
+
+    Returns:
+        str: Formatted traceback only showing frames from the plugin import, if possible
+    """
+
+    import traceback  # pylint: disable=import-outside-toplevel
 
     # Create traceback starting at module for friendly output
     start = 0
@@ -65,32 +91,126 @@ def _raise_friendly_exception(exc, name, path):
     tb_list = traceback.extract_tb(tback)
 
     if path:
+        prefix = path + os.sep
+        prefix_len = len(prefix)
+
         for idx, entry in enumerate(tb_list):
+            filename = entry[0]
+
             # Find index for traceback starting with module we tried to load
-            if os.path.dirname(entry[0]) == path:
+            if filename.startswith(prefix) and os.sep not in filename[prefix_len:]:
                 start = idx
                 break
 
             # Find index for traceback starting with this file
-            if os.path.splitext(entry[0])[0] == os.path.splitext(__file__)[0]:
+            if filename.startswith(_THIS_FILE_PREFIX):
                 here = idx
 
+    # Reuse extracted frames rather than walking the traceback again to format it
     if start == 0 and isinstance(exc, SyntaxError):
-        limit = 0
+        tb_list = []
     else:
-        limit = 0 - len(tb_list) + max(start, here)
+        tb_list = tb_list[max(start, here):]
+
+    rtn = ['Traceback (most recent call last):\n'] if tb_list else []
+    rtn.extend(traceback.format_list(tb_list))
+    rtn.extend(traceback.format_exception_only(exc.__class__, exc))
+
+    return ''.join(rtn)
+
+
+def _raise_friendly_exception(exc, name, path):
+    """
+    Attempt to create a friendly traceback that only shows the errors
+    encountered from the plugin import and no the framework
+
+    The traceback is not formatted until the ``friendly`` attribute is accessed
+    """
 
-    # pylint: disable=wrong-spelling-in-comment
-    # friendly = ''.join(traceback.format_exception(etype, exc, tback, limit))
-    friendly = ''.join(format_exception(etype, exc, tback, limit))
+    tback = getattr(exc, '__traceback__', sys.exc_info()[2])
 
     # Format exception
     msg = 'Error while importing candidate plugin module %s from %s' % (name, path)
-    exception = PluginImportError('%s: %s' % (msg, repr(exc)), friendly=friendly)
+    exception = PluginImportError('%s: %s' % (msg, repr(exc)),
+                                  friendly=partial(_format_friendly, exc, tback, path))
 
     raise_with_traceback(exception, tback)
 
 
+def _all_entry_points():
+    """
+    Returns:
+        Installed `entry points <Entry point_>`_ as returned by
+        :py:func:`importlib.metadata.entry_points`
+
+    Installed distributions are only scanned on the first call
+    """
+
+    global _ALL_ENTRY_POINTS  # pylint: disable=global-statement
+
+    if _ALL_ENTRY_POINTS is None:
+        # importlib.metadata is slow to import, so only import it when needed
+        # pylint: disable=import-outside-toplevel
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # pragma: no cover
+            # For Python < 3.8
+            from importlib_metadata import entry_points
+
+        _ALL_ENTRY_POINTS = entry_points()
+
+    return _ALL_ENTRY_POINTS
+
+
+def _cached_entry_points(group):
+    """
+    Args:
+        group(str): `Entry point`_ group
+
+    Returns:
+        tuple: :py:class:`~importlib.metadata.EntryPoint` objects for the group
+    """
+
+    try:
+        return _ENTRY_POINTS[group]
+    except KeyError:
+        all_epoints = _all_entry_points()
+
+        if hasattr(all_epoints, 'select'):
+            epoints = all_epoints.select(group=group)
+        else:  # pragma: no cover
+            # For Python < 3.10, entry points are returned in a dictionary keyed by group
+            epoints = all_epoints.get(group, ())
+
+        epoints = _ENTRY_POINTS[group] = tuple(epoints)
+        return epoints
+
+
+def _module_path(name):
+    """
+    Args:
+        name(str): Full name of module
+
+    Returns:
+        str: Directory containing the module or :py:data:`None` if it can't be determined
+    """
+
+    try:
+        if PY2:  # pragma: no cover
+            import pkgutil  # pylint: disable=import-outside-toplevel
+            loader = pkgutil.get_loader(name)  # pylint: disable=deprecated-method
+        else:
+            loader = getattr(find_spec(name), 'loader', None)
+    except Exception:  # pylint: disable=broad-except
+        # Finding a submodule imports its parent, which may be what failed
+        return None
+
+    if loader:
+        return os.path.dirname(loader.get_filename(name))
+
+    return None
+
+
 def _import_module(name, path=None):
     """
     Args:
@@ -108,33 +228,152 @@ def _import_module(name, path=None):
 
     # If name is an entry point, try to parse it
     epoint = None
-    if isinstance(name, EntryPoint):
+    if not isinstance(name, BASESTRING):
         epoint = name
-        name = epoint.module_name
+        # EntryPoint.module and EntryPoint.attr are not available for Python < 3.9
+        match = epoint.pattern.match(epoint.value)
+
+        # Malformed values are left for EntryPoint.load() to raise an error on
+        if match is None:
+            name = epoint.value
 
-    if path is None:
-        try:
-            if PY2:
-                # pylint: disable-next=deprecated-method
-                loader = pkgutil.get_loader(name)  # pragma: no cover
-            else:
-                loader = getattr(importlib.util.find_spec(name), 'loader', None)
-        except ImportError:
-            pass
         else:
-            if loader:
-                path = os.path.dirname(loader.get_filename(name))
+            name = match.group('module')
+
+            # Already imported, unless the entry point is for an attribute in the module
+            if not match.group('attr') and sys.modules.get(name) is not None:
+                return sys.modules[name]
+
+    # Already imported, skip import machinery
+    elif sys.modules.get(name) is not None:
+        return sys.modules[name]
+
+    # Called for every module, so skip building log records when debug is disabled
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        if path is None:
+            path = _module_path(name)
+        LOGGER.debug('Attempting to load module %s from %s', name, path)
 
-    LOGGER.debug('Attempting to load module %s from %s', name, path)
     try:
         mod = epoint.load() if epoint else importlib.import_module(name)
 
     except Exception as e:  # pylint: disable=broad-except
+        # Path is only needed for the friendly traceback, so only look it up on failure
+        if path is None:
+            path = _module_path(name)
         _raise_friendly_exception(e, name, path)
 
     return mod
 
 
+def _iter_modules(path, prefix, subdirs=None, scanned=None):
+    """
+    Args:
+        path(list): Package search path
+        prefix(str): Prefix to apply to found modules
+        subdirs(list): If given, names of subdirectories that are not packages are appended
+        scanned(list): If given, paths of subdirectories checked for init files are appended
+
+    Returns:
+        generator: Tuples of module name, module directory, if the module is a package,
+        and the module file (init file for packages)
+
+    Alternative to :py:func:`pkgutil.iter_modules` that classifies modules from a single
+    directory scan rather than creating a finder for each path
+    """
+
+    seen = set()
+
+    for directory in path:
+        try:
+            entries = sorted(scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        for entry in entries:
+            modname = getmodulename(entry.name)
+            is_pkg = False
+            filename = entry.path
+
+            if modname is None:
+                # Directories are only packages if they contain an init file
+                # Errors are ignored like os.walk() does by default
+                if '.' in entry.name:
+                    continue
+                try:
+                    if not entry.is_dir():
+                        continue
+                    # Check the prefix first since getmodulename() tries every module suffix
+                    inits = [subentry.name for subentry in scandir(entry.path)
+                             if subentry.name.startswith('__init__.') and
+                             getmodulename(subentry.name) == '__init__']
+                except OSError:
+                    continue
+                if scanned is not None:
+                    scanned.append(entry.path)
+                if not inits:
+                    # Like os.walk(), don't follow symbolic links to directories
+                    # A link to a parent directory would otherwise be walked forever
+                    if subdirs is not None and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    continue
+                modname = entry.name
+                is_pkg = True
+                # If there are multiple, prefer extension, then source, then bytecode
+                filename = os.path.join(entry.path, min(inits))
+
+            elif modname == '__init__' or '.' in modname:
+                continue
+
+            if modname not in seen:
+                seen.add(modname)
+                yield prefix + modname, directory, is_pkg, filename
+
+
+def _package_modules(path, prefix):
+    """
+    Args:
+        path(list): Package search path
+        prefix(str): Prefix to apply to found modules
+
+    Returns:
+        tuple: Results of :py:func:`_iter_modules`
+
+    Results are cached until the modification time of a directory in the path
+    or a subdirectory checked for init files changes
+    """
+
+    path = tuple(path)
+    key = (path, prefix)
+    cached = _PACKAGE_MODULES.get(key)
+
+    if cached is None or _mtimes(cached[0]) != cached[1]:
+        scanned = list(path)
+        modules = tuple(_iter_modules(path, prefix, scanned=scanned))
+        cached = _PACKAGE_MODULES[key] = (scanned, _mtimes(scanned), modules)
+
+    return cached[2]
+
+
+def _mtimes(directories):
+    """
+    Args:
+        directories(list): Directory paths
+
+    Returns:
+        tuple: Modification time of each directory, None if it can't be read
+    """
+
+    mtimes = []
+    for directory in directories:
+        try:
+            mtimes.append(os.stat(directory).st_mtime)
+        except OSError:
+            mtimes.append(None)
+
+    return tuple(mtimes)
+
+
 def _recursive_import(package):
     """
     Args:
@@ -148,9 +387,61 @@ def _recursive_import(package):
     path = getattr(package, '__path__', None)
 
     if path:
-        # pylint: disable=unused-variable
-        for finder, name, is_pkg in pkgutil.walk_packages(path, prefix=prefix):
-            _import_module(name, finder.path)
+        for name, directory, is_pkg, _ in _package_modules(path, prefix):
+            module = _import_module(name, directory)
+            if is_pkg:
+                _recursive_import(module)
+
+
+if PY2:  # pragma: no cover
+    def _load_from_file(name, directory, filename, is_pkg):  # pylint: disable=unused-argument
+        """
+        Load a module from a file in a directory not on the Python path
+        """
+        import pkgutil  # pylint: disable=import-outside-toplevel
+        importer = pkgutil.get_importer(directory)
+        return importer.find_module(name).load_module(name)  # pylint: disable=deprecated-method
+
+else:
+    def _load_from_file(name, directory, filename, is_pkg):  # pylint: disable=unused-argument
+        """
+        Load a module from a file in a directory not on the Python path
+
+        The spec is created directly from the file found while scanning the directory,
+        so the path finder doesn't need to search for it again
+        """
+        search_locations = [os.path.dirname(filename)] if is_pkg else None
+        spec = spec_from_file_location(name, filename,
+                                       submodule_search_locations=search_locations)
+        module = module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+
+
+def _path_import(path, prefix, debug, subdirs=None):
+    """
+    Args:
+        path(list): Directories to search
+        prefix(str): Prefix to apply to found modules
+        debug(bool): Log each module before it is imported
+        subdirs(list): If given, names of subdirectories that are not packages are appended
+
+    Import modules in directories which are not on the Python path
+    Packages are imported recursively
+    """
+
+    for name, directory, is_pkg, filename in _iter_modules(path, prefix, subdirs):
+        if debug:
+            LOGGER.debug('Attempting to load module %s from %s', name, directory)
+
+        try:
+            module = _load_from_file(name, directory, filename, is_pkg)
+        except Exception as e:  # pylint: disable=broad-except
+            _raise_friendly_exception(e, name, directory)
+
+        if is_pkg:
+            _path_import(module.__path__, '%s.' % name, debug)
 
 
 def _recursive_path_import(path, prefix_package):
@@ -168,42 +459,37 @@ def _recursive_path_import(path, prefix_package):
     """
 
     # Include basename of path in module prefix
-    basename = os.path.basename(path.strip('/'))
-    root_prefix = '%s.%s.' % (prefix_package, basename)
-    prefix_template = '%s%%s.' % root_prefix
-
-    # Walk path
-    for root, dirs, files in os.walk(path):
-        # If root is a Python module, we won't walk any farther down it
-        # find_module() seems to be recursive in Python 3
-        if '__init__.py' in files and not PY2:  # pragma: no cover
-            dirs.clear()
-            if root != path:
-                continue
+    basename = os.path.basename(os.path.normpath(path))
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
 
-        # Generate prefix
-        if root == path:
-            prefix = root_prefix
-        else:
-            relpath = os.path.relpath(root, path)
-            prefix = prefix_template % relpath.replace(os.sep, '.')
-
-        # Walk root and import modules
-        # pylint: disable=unused-variable
-        for finder, name, is_pkg in pkgutil.walk_packages([root], prefix=prefix):
-            LOGGER.debug('Attempting to load module %s from %s', name, finder.path)
-            try:
-                # find_module() was deprecated in 3.4
-                if PY2:  # pragma: no cover
-                    finder.find_module(name).load_module(name)
-                else:
-                    spec = finder.find_spec(name)
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[name] = module
-                    spec.loader.exec_module(module)
+    # If path is a package, only its modules and subpackages are imported
+    if os.path.isfile(os.path.join(path, '__init__.py')):
+        _path_import([path], '%s.%s.' % (prefix_package, basename), debug)
+        return
+
+    # Otherwise walk directories that aren't packages, parents before children
+    # The list is extended while iterating
+    walk = [(path, '%s.%s.' % (prefix_package, basename))]
+    for directory, prefix in walk:
+        subdirs = []
+        _path_import([directory], prefix, debug, subdirs)
+        walk.extend((os.path.join(directory, subdir), '%s%s.' % (prefix, subdir))
+                    for subdir in subdirs)
+
+
+def _copy_plugins(plugins):
+    """
+    Args:
+        plugins: Filtered plugins
+
+    Returns:
+        Copy of nested dictionaries in plugins, plugin classes are not copied
+    """
+
+    if isinstance(plugins, dict):
+        return plugins.__class__((key, _copy_plugins(val)) for key, val in plugins.items())
 
-            except Exception as e:  # pylint: disable=broad-except
-                _raise_friendly_exception(e, name, root)
+    return plugins
 
 
 # pylint: disable=too-many-instance-attributes,too-many-arguments
@@ -256,30 +542,47 @@ class PluginLoader(object):
     .. _Entry point: https://packaging.python.org/specifications/entry-points/
     """
 
+    __slots__ = ('group', 'library', 'modules', 'paths', 'entry_point', 'prefix_package',
+                 'type_filter', 'loaded', 'blacklist', '_plugin_cache', '_plugin_cache_state',
+                 '__weakref__')
+
+    # Attributes shown in repr() when they differ from their default
+    _REPR_ATTRS = (('group', '_default'), ('library', None), ('modules', None),
+                   ('paths', None), ('entry_point', None), ('blacklist', None),
+                   ('prefix_package', 'pluginlib.importer'), ('type_filter', None))
+
     # pylint: disable-next=too-many-positional-arguments
     def __init__(self, group=None, library=None, modules=None, paths=None, entry_point=None,
                  blacklist=None, prefix_package='pluginlib.importer', type_filter=None):
 
-        # Make sure we got iterables
-        for argname, arg in (('modules', modules), ('paths', paths), ('blacklist', blacklist),
-                             ('type_filter', type_filter)):
-            if not isinstance(arg, (NoneType, Iterable)) or isinstance(arg, BASESTRING):
-                raise TypeError("Expecting iterable for '%s', received %s" % (argname, type(arg)))
+        # Make sure we got iterables and strings
+        for argname, arg, expected in (('modules', modules, 'iterable'),
+                                       ('paths', paths, 'iterable'),
+                                       ('blacklist', blacklist, 'iterable'),
+                                       ('type_filter', type_filter, 'iterable'),
+                                       ('library', library, 'string'),
+                                       ('entry_point', entry_point, 'string'),
+                                       ('prefix_package', prefix_package, 'string')):
+
+            if expected == 'string':
+                valid = isinstance(arg, _NONE_OR_STRING)
+            else:
+                valid = _is_iterable(arg)
 
-        # Make sure we got strings
-        for argname, arg in (('library', library), ('entry_point', entry_point),
-                             ('prefix_package', prefix_package)):
-            if not isinstance(arg, (NoneType, BASESTRING)):
-                raise TypeError("Expecting string for '%s', received %s" % (argname, type(arg)))
+            if not valid:
+                raise TypeError("Expecting %s for '%s', received %s" %
+                                (expected, argname, type(arg)))
 
         self.group = group or '_default'
         self.library = library
-        self.modules = modules or tuple()
-        self.paths = paths or tuple()
+        self.modules = tuple(modules) if modules else tuple()
+        self.paths = tuple(paths) if paths else tuple()
         self.entry_point = entry_point
         self.prefix_package = prefix_package
-        self.type_filter = type_filter
+        self.type_filter = tuple(type_filter) if type_filter else None
         self.loaded = False
+        self._plugin_cache = {}
+        self._plugin_cache_state = None
 
         if blacklist:
             self.blacklist = []
@@ -287,7 +590,8 @@ class PluginLoader(object):
 
                 if isinstance(entry, BlacklistEntry):
                     pass
-                elif isinstance(entry, Iterable):
+                # Check for tuple first to avoid the slower abstract base class check
+                elif isinstance(entry, (tuple, Iterable)):
                     try:
                         entry = BlacklistEntry(*entry)
                     except (AttributeError, TypeError) as e:
@@ -306,15 +610,9 @@ class PluginLoader(object):
     def __repr__(self):
 
         args = []
-        for attr, default in (('group', '_default'), ('library', None), ('modules', None),
-                              ('paths', None), ('entry_point', None), ('blacklist', None),
-                              ('prefix_package', 'pluginlib.importer'), ('type_filter', None)):
-
+        for attr, default in self._REPR_ATTRS:
             val = getattr(self, attr)
-            if default and val == default:
-                continue
-
-            if val:
+            if val and val != default:
                 args.append('%s=%r' % (attr, val))
 
         return '%s(%s)' % (self.__class__.__name__, ', '.join(args))
@@ -343,22 +641,30 @@ class PluginLoader(object):
             _recursive_import(libmod)
 
         # Get entry points
+        # Entry points are imported serially and in order. Importing registers plugins,
+        # and when duplicates exist the first registered wins, so concurrent imports
+        # would make the result nondeterministic
         if self.entry_point:
             LOGGER.info('Loading plugins from entry points group %s', self.entry_point)
-            for epoint in iter_entry_points(group=self.entry_point):
-                try:
-                    mod = _import_module(epoint)
-                except PluginImportError as e:
-                    warnings.warn("Module %s can not be loaded for entry point %s: %s" %
-                                  (epoint.module_name, epoint.name, e), EntryPointWarning)
-                    continue
-
-                # If we have a package, walk it
-                if ismodule(mod):
-                    _recursive_import(mod)
-                else:
-                    warnings.warn("Entry point '%s' is not a module or package" % epoint.name,
-                                  EntryPointWarning)
+            for epoint in _cached_entry_points(self.entry_point):
+                # Failures are remembered so other loaders don't import them again
+                error = _FAILED_ENTRY_POINTS.get(epoint.value)
+                if error is None:
+                    try:
+                        mod = _import_module(epoint)
+                    except PluginImportError as e:
+                        error = _FAILED_ENTRY_POINTS[epoint.value] = str(e)
+                    else:
+                        # If we have a package, walk it
+                        if ismodule(mod):
+                            _recursive_import(mod)
+                        else:
+                            warnings.warn("Entry point '%s' is not a module or package" %
+                                          epoint.name, EntryPointWarning)
+                        continue
+
+                warnings.warn("Module %s can not be loaded for entry point %s: %s" %
+                              (epoint.value, epoint.name, error), EntryPointWarning)
 
         # Load auxiliary modules
         if self.modules:
@@ -368,9 +674,14 @@ class PluginLoader(object):
 
         # Load auxiliary paths
         if self.paths:
-            # Import each path recursively
+            # Import each path recursively, skipping paths that resolve to one already seen
+            seen = set()
             for path in self.paths:
                 modpath = os.path.realpath(path)
+                if modpath in seen:
+                    LOGGER.info("Skipping duplicate plugin path `%s`", path)
+                    continue
+                seen.add(modpath)
                 if os.path.isdir(modpath):
                     LOGGER.info("Recursively importing plugins from path `%s`", path)
                     _recursive_path_import(path, self.prefix_package)
@@ -395,12 +706,7 @@ class PluginLoader(object):
         Child plugins will only be included if a valid, non-blacklisted plugin is available.
         """
 
-        if not self.loaded:
-            self.load_modules()
-
-        # pylint: disable=protected-access
-        return get_plugins()[self.group]._filter(blacklist=self.blacklist, newest_only=True,
-                                                 type_filter=self.type_filter)
+        return self._filtered_plugins(newest_only=True)
 
     @property
     def plugins_all(self):
@@ -425,12 +731,56 @@ class PluginLoader(object):
             tuple(plugins.parser.json.values())[-1]
         """
 
+        return self._filtered_plugins(newest_only=False)
+
+    def _filtered_plugins(self, newest_only, plugin_type=None, name=None, version=None):
+        """
+        Args:
+            newest_only(bool): Only the newest version of each plugin is returned
+            plugin_type(str): Parent type
+            name(str): Plugin name
+            version(str): Plugin version
+
+        Returns:
+            Filtered plugins for the group
+
+        Filtered results are cached until plugins are registered or removed or
+        ``group``, ``blacklist``, or ``type_filter`` are changed.
+        Up to ``_PLUGIN_CACHE_SIZE`` results are kept.
+        Copies of cached results are returned, so callers can modify them.
+        """
+
         if not self.loaded:
             self.load_modules()
 
+        # Results are stale if the registry, group, or filters were changed
+        state = (get_plugins_generation(), self.group,
+                 tuple((entry.type, entry.name, entry.version, entry.operator)
+                       for entry in self.blacklist or ()),
+                 tuple(self.type_filter or ()))
+        if state != self._plugin_cache_state:
+            self._plugin_cache.clear()
+            self._plugin_cache_state = state
+
+        key = (newest_only, plugin_type, name, version)
+        try:
+            return _copy_plugins(self._plugin_cache[key])
+        except KeyError:
+            pass
+
+        # Bound memory when many different plugins are requested with get_plugin()
+        if len(self._plugin_cache) >= _PLUGIN_CACHE_SIZE:
+            self._plugin_cache.clear()
+
         # pylint: disable=protected-access
-        return get_plugins()[self.group]._filter(blacklist=self.blacklist,
-                                                 type_filter=self.type_filter)
+        plugins = self._plugin_cache[key] = \
+            get_plugins()[self.group]._filter(blacklist=self.blacklist,
+                                              newest_only=newest_only,
+                                              type_filter=self.type_filter,
+                                              type=plugin_type,
+                                              name=name,
+                                              version=version)
+        return _copy_plugins(plugins)
 
     def get_plugin(self, plugin_type, name, version=None):
         """
@@ -445,15 +795,27 @@ class PluginLoader(object):
         Retrieve a specific plugin. ``blacklist`` and ``type_filter`` still apply.
 
         If ``version`` is not specified, the newest available version is returned.
+
+        Like :py:attr:`plugins`, all configured sources are loaded on the first call.
+        Plugin names and versions are class attributes, so any module could provide
+        the requested plugin or a newer version of it.
         """
 
-        if not self.loaded:
-            self.load_modules()
+        return self._filtered_plugins(True, plugin_type, name, version)
 
-        # pylint: disable=protected-access
-        return get_plugins()[self.group]._filter(blacklist=self.blacklist,
-                                                 newest_only=True,
-                                                 type_filter=self.type_filter,
-                                                 type=plugin_type,
-                                                 name=name,
-                                                 version=version)
+    @staticmethod
+    def clear_entry_point_cache():
+        """
+        Clear cached `entry points <Entry point_>`_
+
+        Installed entry points are only discovered once per process and shared by all loaders.
+        Entry points that fail to import are not retried.
+        Call this if distributions are installed or removed after the first loader
+        has loaded entry points. It does not affect modules that were already imported.
+        """
+
+        global _ALL_ENTRY_POINTS  # pylint: disable=global-statement
+
+        _ALL_ENTRY_POINTS = None
+        _ENTRY_POINTS.clear()
+        _FAILED_ENTRY_POINTS.clear()
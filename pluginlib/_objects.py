@@ -1,4 +1,4 @@
-# Copyright 2014 - 2022 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -11,11 +11,45 @@ This module contains pluginlib object classes
 """
 
 from collections import OrderedDict
-from pkg_resources import parse_version
 
 from pluginlib._util import BASESTRING, CachingDict, DictWithDotNotation, OPERATORS
 
 
+# Parsed versions, keyed by version string
+_VERSIONS = {}
+_VERSIONS_SIZE = 4096
+
+
+def parse_version(version):
+    """
+    Parse version string into a :py:class:`packaging.version.Version`
+
+    Versions that don't conform to PEP 440 are treated as ``'0'``.
+
+    The same versions are compared repeatedly, so results are cached.
+    packaging is only imported when a version is parsed.
+    """
+
+    try:
+        return _VERSIONS[version]
+    except KeyError:
+        pass
+
+    # pylint: disable-next=import-outside-toplevel
+    from packaging.version import InvalidVersion, Version
+
+    if len(_VERSIONS) >= _VERSIONS_SIZE:
+        _VERSIONS.clear()
+
+    try:
+        parsed = Version(version)
+    except InvalidVersion:
+        parsed = Version('0')
+
+    _VERSIONS[version] = parsed
+    return parsed
+
+
 class BlacklistEntry(object):
     """
     Args:
@@ -42,7 +76,7 @@ class BlacklistEntry(object):
 
             BlacklistEntry('parser', 'json', '>=', '1.0')
 
-    ``version`` is evaluated using :py:func:`pkg_resources.parse_version`
+    ``version`` is evaluated using :py:class:`packaging.version.Version`
     and should conform to `PEP 440`_
 
     .. _PEP 440: https://www.python.org/dev/peps/pep-0440/
@@ -99,23 +133,20 @@ class GroupDict(DictWithDotNotation):
             type_filter(list): Optional iterable of types to return (GroupDict only)
             name(str): Only return key by this name
 
-        Alternative generator for items() method
+        Alternative to items() method
+
+        When nothing is filtered, items() is returned directly
         """
 
         if name:
-            if type_filter and self._key_attr == 'type':
-                if name in type_filter and name in self:
-                    yield name, self[name]
-            elif name in self:
-                yield name, self[name]
-
-        elif type_filter and self._key_attr == 'type':
-            for key, val in self.items():
-                if key in type_filter:
-                    yield key, val
-        else:
-            for key, val in self.items():
-                yield key, val
+            if type_filter and self._key_attr == 'type' and name not in type_filter:
+                return ()
+            return ((name, self[name]),) if name in self else ()
+
+        if type_filter and self._key_attr == 'type':
+            return ((key, val) for key, val in self.items() if key in type_filter)
+
+        return self.items()
 
     def _filter(self, blacklist=None, newest_only=False, type_filter=None, **kwargs):
         """
@@ -134,35 +165,44 @@ class GroupDict(DictWithDotNotation):
         plugins = DictWithDotNotation()
         filtered_name = kwargs.get(self._key_attr, None)
 
+        if blacklist:
+            # Assume blacklist is correct format since it is checked by PluginLoader
+            # Index entries by key for this level so each key only checks relevant entries
+            # Each item is (entry, wildcard for lower levels)
+            # Entries without a key for this level apply to all keys
+            bl_index = {}
+            for entry in blacklist:
+                wild = all(getattr(entry, attr) is None for attr in self._bl_skip_attrs)
+                bl_index.setdefault(getattr(entry, self._key_attr), []).append((entry, wild))
+            bl_all = bl_index.pop(None, [])
+
+        # When filtering by name, there is at most one item, so it is returned directly
         for key, val in self._items(type_filter, filtered_name):
             plugin_blacklist = None
-            skip = False
 
             if blacklist:
+                entries = bl_all + bl_index.get(key, [])
 
-                # Assume blacklist is correct format since it is checked by PluginLoade
+                if any(wild for _, wild in entries):
+                    if filtered_name:
+                        return None
+                    if not self._skip_empty:
+                        plugins[key] = self._bl_empty()
+                    continue
 
-                plugin_blacklist = []
-                for entry in blacklist:
-                    if getattr(entry, self._key_attr) not in (key, None):
-                        continue
-                    if all(getattr(entry, attr) is None for attr in self._bl_skip_attrs):
-                        if not self._skip_empty:
-                            plugins[key] = None if filtered_name else self._bl_empty()
-                        skip = True
-                        break
+                plugin_blacklist = [entry for entry, _ in entries]
 
-                    plugin_blacklist.append(entry)
+            # pylint: disable=protected-access
+            result = val._filter(plugin_blacklist, newest_only=newest_only, **kwargs)
 
-            if not skip:
-                # pylint: disable=protected-access
-                result = val._filter(plugin_blacklist, newest_only=newest_only, **kwargs)
+            if filtered_name:
+                return result if result or not self._skip_empty else None
 
-                if result or not self._skip_empty:
-                    plugins[key] = result
+            if result or not self._skip_empty:
+                plugins[key] = result
 
         if filtered_name:
-            return plugins.get(filtered_name, None)
+            return None
         return plugins
 
 
@@ -190,7 +230,7 @@ class PluginDict(CachingDict):
         """
         Return list of keys sorted by version
 
-        Sorting is done based on :py:func:`pkg_resources.parse_version`
+        Sorting is done based on :py:class:`packaging.version.Version`
         """
 
         try:
@@ -200,6 +240,39 @@ class PluginDict(CachingDict):
 
         return keys
 
+    def _newest_key(self):
+        """
+        Return key with the highest version
+
+        Uses the sorted keys when already cached, otherwise avoids a full sort
+        """
+
+        try:
+            return self._cache['newest_key']
+        except KeyError:
+            pass
+
+        if 'sorted_keys' in self._cache:
+            key = self._cache['sorted_keys'][-1]
+        else:
+            # Match sorted() on ties, where the last of equal versions is newest
+            key = max(reversed(tuple(self)), key=parse_version)
+
+        self._cache['newest_key'] = key
+        return key
+
+    def _parsed_keys(self):
+        """
+        Return list of (key, parsed version) tuples
+        """
+
+        try:
+            parsed_keys = self._cache['parsed_keys']
+        except KeyError:
+            parsed_keys = self._cache['parsed_keys'] = [(key, parse_version(key)) for key in self]
+
+        return parsed_keys
+
     def _process_blacklist(self, blacklist):
         """
         Process blacklist into set of excluded versions
@@ -224,8 +297,8 @@ class PluginDict(CachingDict):
                 blackversion = parse_version(entry.version or '0')
                 blackop = OPERATORS[entry.operator]
 
-                for key in self:
-                    if blackop(parse_version(key), blackversion):
+                for key, parsed in self._parsed_keys():
+                    if blackop(parsed, blackversion):
                         entry_cache.add(key)
 
         self._cache['blacklist'] = blacklist_cache
@@ -263,16 +336,14 @@ class PluginDict(CachingDict):
                             break
                     # If no keys are left, None will be returned
                 else:
-                    rtn = OrderedDict()
-                    for key in self._sorted_keys():
-                        if key not in blacklist:
-                            rtn[key] = self[key]
+                    rtn = OrderedDict((key, self[key]) for key in self._sorted_keys()
+                                      if key not in blacklist)
 
             elif version:
                 rtn = self.get(version, None)
 
             elif newest_only:
-                rtn = self[self._sorted_keys()[-1]]
+                rtn = self[self._newest_key()]
 
             else:
                 rtn = OrderedDict((key, self[key]) for key in self._sorted_keys())
@@ -1,4 +1,4 @@
-# Copyright 2014 - 2024 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -13,6 +13,7 @@ Provides plugin bases class and Parent decorator
 import inspect
 import sys
 import warnings
+import weakref
 
 from pluginlib.exceptions import PluginWarning
 from pluginlib._objects import GroupDict, TypeDict, PluginDict
@@ -37,6 +38,29 @@ try:
 except NameError:
     STR = str
 
+# Indexes of argument spec fields to compare, annotations are checked separately
+_ARGSPEC_FIELDS = tuple(idx for idx, field in enumerate(getfullargspec(lambda: None)._fields)
+                        if field != 'annotations')
+
+# Argument specs of abstract methods, which are compared for every child plugin
+_ARGSPECS = weakref.WeakKeyDictionary()
+
+
+def _abstract_argspec(func):
+    """
+    Args:
+        func(:py:class:`function`): Abstract method function
+
+    Returns:
+        :py:class:`inspect.FullArgSpec`: Cached argument spec for func
+    """
+
+    try:
+        return _ARGSPECS[func]
+    except KeyError:
+        spec = _ARGSPECS[func] = getfullargspec(func)
+        return spec
+
 
 class ClassInspector(object):
     """
@@ -77,6 +101,8 @@ class ClassInspector(object):
         * 220: Argument spec does not match
     """
 
+    __slots__ = ('message', 'errorcode', 'cls', 'subclass')
+
     def __init__(self, cls, subclass):
 
         self.message = None
@@ -85,7 +111,7 @@ class ClassInspector(object):
         self.subclass = subclass
 
         self._check_skipload()
-        if not self.errorcode:
+        if not self.errorcode and self.cls.__abstractmethods__:
             self._check_methods()
 
     def __bool__(self):
@@ -185,7 +211,7 @@ class ClassInspector(object):
             self.errorcode = 211
             self.message = 'Does not contain required static method (%s)' % name
         else:
-            self._compare_argspec(name, getfullargspec(method.__func__),
+            self._compare_argspec(name, _abstract_argspec(method.__func__),
                                   getfullargspec(submethod.__func__))
 
     def _check_class_method(self, name, method, submethod):
@@ -202,7 +228,7 @@ class ClassInspector(object):
             self.errorcode = 212
             self.message = 'Does not contain required class method (%s)' % name
         else:
-            self._compare_argspec(name, getfullargspec(method.__func__),
+            self._compare_argspec(name, _abstract_argspec(method.__func__),
                                   getfullargspec(submethod.__func__))
 
     def _check_generic_method(self, name, method, submethod):
@@ -219,7 +245,7 @@ class ClassInspector(object):
             self.errorcode = 213
             self.message = 'Does not contain required method (%s)' % name
         else:
-            self._compare_argspec(name, getfullargspec(method), getfullargspec(submethod))
+            self._compare_argspec(name, _abstract_argspec(method), getfullargspec(submethod))
 
     def _check_coroutine_method(self, name, method, submethod):
         """
@@ -262,22 +288,22 @@ class ClassInspector(object):
         Compares two argspecs skipping type annotations
         """
 
-        spec_1_dict = spec_1._asdict()
-        spec_2_dict = spec_2._asdict()
+        if not all(spec_1[idx] == spec_2[idx] for idx in _ARGSPEC_FIELDS):
+            self.errorcode = 220
+            self.message = 'Argument spec does not match parent for method %s' % name
 
-        matches = True
 
-        for key, val in spec_1_dict.items():
-            # Annotations are checked separately
-            if key == 'annotations':
-                continue
-            if spec_2_dict[key] != val:
-                matches = False
-                break
+class _RegistryGroupDict(GroupDict):
+    """
+    Container for a registered plugin group
 
-        if not matches:
-            self.errorcode = 220
-            self.message = 'Argument spec does not match parent for method %s' % name
+    Clearing the group marks cached results based on :py:func:`get_plugins` as stale
+    """
+
+    def clear(self):
+
+        super(_RegistryGroupDict, self).clear()
+        PluginType._generation += 1
 
 
 class PluginType(type):
@@ -285,7 +311,8 @@ class PluginType(type):
     Metaclass for plugins
     """
 
-    __plugins = DictWithDotNotation([(DEFAULT, GroupDict())])
+    __plugins = DictWithDotNotation([(DEFAULT, _RegistryGroupDict())])
+    _generation = 0
 
     # pylint: disable=bad-mcs-classmethod-argument
     def __new__(cls, name, bases, namespace, **kwargs):
@@ -298,13 +325,14 @@ class PluginType(type):
         new = super(PluginType, cls).__new__(cls, name, bases, namespace, **kwargs)
 
         # Determine group
-        group = cls.__plugins.setdefault(new._group_ or DEFAULT, GroupDict())
+        group = cls.__plugins.setdefault(new._group_ or DEFAULT, _RegistryGroupDict())
+        typedict = group.get(new._type_)
 
-        if new._type_ in group:
+        if typedict is not None:
             if new._parent_:
                 raise ValueError('parent must be unique: %s' % new._type_)
 
-            plugindict = group[new._type_].get(new.name, UNDEFINED)
+            plugindict = typedict.get(new.name, UNDEFINED)
             version = STR(new.version or 0)
 
             # Check for duplicates. Warn and ignore
@@ -317,10 +345,11 @@ class PluginType(type):
                               PluginWarning, stacklevel=2)
 
             else:
-                result = ClassInspector(group[new._type_]._parent, new)
+                result = ClassInspector(typedict._parent, new)
 
                 if result:
-                    group[new._type_].setdefault(new.name, PluginDict())[version] = new
+                    typedict.setdefault(new.name, PluginDict())[version] = new
+                    PluginType._generation += 1
 
                 else:
                     skipmsg = u'Skipping %s class %s.%s: Reason: %s'
@@ -335,6 +364,7 @@ class PluginType(type):
 
         elif new._parent_:
             group[new._type_] = TypeDict(new)
+            PluginType._generation += 1
 
             new.__abstractmethods__ = {}
 
@@ -468,23 +498,23 @@ class Parent(object):
 
         # In case we're inheriting another parent, clean registry
         if isinstance(cls, PluginType):
-            plugins = cls._get_plugins().get(cls.name, {})
+            registry = cls._get_plugins()
+            plugins = registry.get(cls.name, {})
             remove = [pver for pver, pcls in plugins.items() if cls is pcls]
 
             if plugins and len(remove) == len(plugins):
-                del cls._get_plugins()[cls.name]
+                del registry[cls.name]
+                PluginType._generation += 1
 
             else:
                 for key in remove:
                     del plugins[key]
+                PluginType._generation += 1
 
-        dict_ = cls.__dict__.copy()
-        dict_.pop('__dict__', None)
-        dict_.pop('__weakref__', None)
-
-        # Clean out slot members
-        for member in dict_.get('__slots__', ()):
-            dict_.pop(member, None)
+        # Copy class dictionary without instance descriptors and slot members
+        skip = set(('__dict__', '__weakref__'))
+        skip.update(cls.__dict__.get('__slots__', ()))
+        dict_ = {key: val for key, val in cls.__dict__.items() if key not in skip}
 
         # Set type
         dict_['_type_'] = self.plugin_type or cls.__name__
@@ -509,3 +539,14 @@ def get_plugins():
 
     # pylint: disable=protected-access
     return PluginType._PluginType__plugins
+
+
+def get_plugins_generation():
+    """
+    Counter incremented whenever a parent or child plugin is registered or removed
+
+    Used to determine if cached results based on :py:func:`get_plugins` are stale
+    """
+
+    # pylint: disable=protected-access
+    return PluginType._generation
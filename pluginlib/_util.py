@@ -1,4 +1,4 @@
-# Copyright 2014 - 2023 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -15,6 +15,7 @@ from functools import update_wrapper, wraps
 from inspect import isclass
 import logging
 import operator as _operator
+import os
 import sys
 
 
@@ -36,6 +37,35 @@ OPERATORS = {'=': _operator.eq,
 
 NoneType = type(None)
 
+try:
+    from os import scandir  # noqa: F401  # pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # For Python < 3.5
+    class _DirEntry(object):
+        """
+        Minimal substitute for os.DirEntry
+        """
+
+        __slots__ = ('name', 'path')
+
+        def __init__(self, directory, name):
+            self.name = name
+            self.path = os.path.join(directory, name)
+
+        def is_dir(self, follow_symlinks=True):
+            """
+            Return True if the entry is a directory
+            """
+            if not follow_symlinks and os.path.islink(self.path):
+                return False
+            return os.path.isdir(self.path)
+
+    def scandir(path):
+        """
+        Minimal substitute for os.scandir
+        """
+        return [_DirEntry(path, name) for name in os.listdir(path)]
+
 if PY2:  # pragma: no branch
     BASESTRING = basestring  # pragma: no cover  # noqa: F821 # pylint: disable=undefined-variable
 else:
@@ -61,17 +91,6 @@ else:
 """)
 
 
-def raise_from_none(exc):  # pragma: no cover
-    """
-    Convenience function to raise from None in a Python 2/3 compatible manner
-    """
-    raise exc
-
-
-if not PY2:  # pragma: no branch
-    exec('def raise_from_none(exc):\n    raise exc from None')  # pylint: disable=exec-used
-
-
 class ClassProperty(object):
     """
     Property decorator for class methods
@@ -159,11 +178,11 @@ class CachingDict(dict):
 
     def setdefault(self, key, default=None):
 
-        try:
+        if key in self:
             return self[key]
-        except KeyError:
-            self[key] = default
-            return default
+
+        self[key] = default
+        return default
 
     def pop(self, *args):
         try:
@@ -184,17 +203,22 @@ class CachingDict(dict):
         return item
 
 
+_MISSING = Undefined('MISSING')
+
+
 class DictWithDotNotation(dict):
     """
     Dictionary addressable by dot notation
     """
 
-    # pylint: disable=inconsistent-return-statements  # PY2 compatibility
     def __getattr__(self, name):
-        try:
-            return self[name]
-        except KeyError:
-            raise_from_none(AttributeError("'dict' object has no attribute '%s'" % name))
+
+        # Avoid raising and discarding a KeyError on misses
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError("'dict' object has no attribute '%s'" % name)
+
+        return value
 
 
 class abstractstaticmethod(staticmethod):  # noqa: N801  # pylint: disable=invalid-name
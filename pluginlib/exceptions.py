@@ -1,4 +1,4 @@
-# Copyright 2014 - 2018 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -49,8 +49,33 @@ class PluginImportError(PluginlibError):
             "friendly" version of the output with a traceback limited to the plugin itself
             or, failing that, the loader module.
 
+            If a callable is supplied, it is called the first time ``friendly`` is accessed
+            and the result is kept, so the traceback is only formatted when it is used.
+            It is also called when the exception is pickled.
+
     """
 
+    @property
+    def friendly(self):
+        """
+        Friendly output, generated on first access if a callable was supplied
+        """
+
+        if callable(self._friendly):
+            self._friendly = self._friendly()
+
+        return self._friendly
+
+    @friendly.setter
+    def friendly(self, value):
+        self._friendly = value
+
+    def __reduce__(self):
+
+        # Generate friendly output first, since the callable holds a traceback
+        self.friendly = self.friendly
+        return super(PluginImportError, self).__reduce__()
+
 
 class PluginWarning(UserWarning):
     """
@@ -1,4 +1,4 @@
-# Copyright 2014 - 2018 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -8,11 +8,12 @@
 **Test module for pluginlib.exceptions**
 """
 
+import pickle
 import warnings
 
 from pluginlib import exceptions
 
-from tests import TestCase
+from tests import TestCase, mock
 
 
 # Because we want the test names to match the class names
@@ -43,6 +44,30 @@ class TestExceptions(TestCase):
             raise exceptions.PluginImportError(friendly=self.msg)
         self.assertEqual(e.exception.friendly, self.msg)
 
+    def test_plugin_import_error_lazy(self):
+        """Callable for friendly output is only called once when accessed"""
+
+        friendly = mock.Mock(return_value=self.msg)
+
+        with self.assertRaises(exceptions.PluginlibError) as e:
+            raise exceptions.PluginImportError(friendly=friendly)
+        friendly.assert_not_called()
+
+        self.assertEqual(e.exception.friendly, self.msg)
+        self.assertEqual(e.exception.friendly, self.msg)
+        friendly.assert_called_once_with()
+
+    def test_plugin_import_error_pickle(self):
+        """Friendly output is generated when pickled so callable isn't pickled"""
+
+        error = exceptions.PluginImportError('Import failed', friendly=lambda: self.msg)
+        unpickled = pickle.loads(pickle.dumps(error))
+
+        self.assertIsInstance(unpickled, exceptions.PluginImportError)
+        self.assertEqual(unpickled.args, ('Import failed',))
+        self.assertEqual(unpickled.friendly, self.msg)
+        self.assertEqual(error.friendly, self.msg)
+
 
 class TestWarnings(TestCase):
     """Tests for custom warnings"""
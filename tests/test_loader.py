@@ -1,4 +1,4 @@
-# Copyright 2014 - 2022 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -8,17 +8,20 @@
 **Test module for pluginlib._loader**
 """
 
+import io
+import logging
 import os
+import shutil
 import sys
+import tempfile
 import warnings
-
-from pkg_resources import Distribution, EntryPoint, working_set
+import weakref
 
 import pluginlib._loader as loader
 from pluginlib._objects import OrderedDict
-from pluginlib import BlacklistEntry, PluginImportError, EntryPointWarning, PluginWarning
+from pluginlib import BlacklistEntry, Parent, PluginImportError, EntryPointWarning
 
-from tests import TestCase, OUTPUT, mock
+from tests import TestCase, OUTPUT, mock, unittest
 import tests.testdata
 import tests.testdata.parents
 
@@ -27,11 +30,51 @@ try:
 except ImportError:
     pass
 
+try:
+    from importlib import metadata
+except ImportError:
+    import importlib_metadata as metadata  # pylint: disable=import-error
+
 
 DATAPATH = os.path.dirname(tests.testdata.__file__)
-DIST = Distribution.from_filename(tests.testdata.__file__)
-working_set.add(DIST)
-DIST._ep_map = {}  # pylint: disable=protected-access
+
+
+class TestDistribution(metadata.Distribution):
+    """Distribution with entry points that can be set by tests"""
+
+    def __init__(self):
+        self.entry_points_txt = ''
+
+    def read_text(self, filename):
+        if filename == 'METADATA':
+            return 'Metadata-Version: 2.1\nName: pluginlib-testdata\nVersion: 1.0\n'
+        if filename == 'entry_points.txt':
+            return self.entry_points_txt
+        return None
+
+    def locate_file(self, path):
+        return os.path.join(DATAPATH, path)
+
+
+class TestDistributionFinder(object):
+    """Meta path finder that only provides the test distribution"""
+
+    @staticmethod
+    def find_spec(*args, **kwargs):  # pylint: disable=unused-argument
+        """Never finds modules"""
+        return None
+
+    # For Python 2
+    find_module = find_spec
+
+    @staticmethod
+    def find_distributions(*args, **kwargs):  # pylint: disable=unused-argument
+        """Only finds test distribution"""
+        return iter((DIST,))
+
+
+DIST = TestDistribution()
+sys.meta_path.append(TestDistributionFinder())
 
 
 class TestPluginLoaderInit(TestCase):
@@ -58,6 +101,17 @@ class TestPluginLoaderInit(TestCase):
             with self.assertRaises(TypeError):
                 loader.PluginLoader(**{arg: 8675309})
 
+    def test_iterable_arguments(self):
+        """Any non-string iterable is accepted and stored as a tuple"""
+
+        ploader = loader.PluginLoader(modules=iter(['avengers.iwar']),
+                                      paths={'/avengers/stark': None},
+                                      type_filter=['parser'])
+
+        self.assertEqual(ploader.modules, ('avengers.iwar',))
+        self.assertEqual(ploader.paths, ('/avengers/stark',))
+        self.assertEqual(ploader.type_filter, ('parser',))
+
     def test_blacklist_argument(self):
         """blacklist argument gets verified and processed in init"""
 
@@ -98,7 +152,7 @@ class TestPluginLoaderInit(TestCase):
         """Only non-default settings show up in repr"""
 
         ploader = loader.PluginLoader(modules=['avengers.iwar', 'avengers.stark'], group='Avengers')
-        output = "PluginLoader(group='Avengers', modules=['avengers.iwar', 'avengers.stark'])"
+        output = "PluginLoader(group='Avengers', modules=('avengers.iwar', 'avengers.stark'))"
         self.assertEqual(repr(ploader), output)
 
         blacklist = [('parser', 'json'), ('parser', 'xml', '<', '1.0')]
@@ -107,6 +161,23 @@ class TestPluginLoaderInit(TestCase):
         ploader = loader.PluginLoader(blacklist=blacklist)
         self.assertEqual(repr(ploader), output)
 
+        # Reassigned attributes are reflected
+        ploader.blacklist = None
+        ploader.group = 'Avengers'
+        self.assertEqual(repr(ploader), "PluginLoader(group='Avengers')")
+
+    def test_slots(self):
+        """Loader instances don't have an instance dictionary"""
+
+        ploader = loader.PluginLoader()
+        self.assertFalse(hasattr(ploader, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            ploader.not_an_attribute = True  # pylint: disable=assigning-non-slot
+
+        # Weak references are still supported
+        self.assertIs(weakref.ref(ploader)(), ploader)
+
 
 def unload(module):
     """Unload a package/module and all submodules from sys.modules"""
@@ -127,7 +198,8 @@ class TestPluginLoader(TestCase):
     def tearDown(self):
 
         # Clear entry points
-        DIST._ep_map.clear()
+        DIST.entry_points_txt = ''
+        loader.PluginLoader.clear_entry_point_cache()
 
         loader.get_plugins().clear()
         unload('tests.testdata.lib')
@@ -159,12 +231,10 @@ class TestPluginLoader(TestCase):
     def test_load_entry_points_pkg(self):
         """Load modules from entry points"""
 
-        # Entry point is package
-        epoint1 = EntryPoint.parse('hooks = tests.testdata.lib.hooks', dist=DIST)
-        # Entry point is module
-        epoint2 = EntryPoint.parse('parsers = tests.testdata.lib.parsers.xml', dist=DIST)
-
-        DIST._ep_map = {'pluginlib.test.plugins': {'hooks': epoint1, 'parsers': epoint2}}
+        # First entry point is package, second is module
+        DIST.entry_points_txt = ('[pluginlib.test.plugins]\n'
+                                 'hooks = tests.testdata.lib.hooks\n'
+                                 'parsers = tests.testdata.lib.parsers.xml\n')
 
         ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
         plugins = ploader.plugins
@@ -183,34 +253,102 @@ class TestPluginLoader(TestCase):
         self.assertEqual(len(plugins.parser), 1)
         self.assertTrue('xml' in plugins.parser)
 
+    def test_load_entry_points_cached(self):
+        """Entry points are only scanned once"""
+
+        DIST.entry_points_txt = ('[pluginlib.test.plugins]\n'
+                                 'parsers = tests.testdata.lib.parsers.xml\n')
+
+        with mock.patch.object(metadata, 'entry_points',
+                               wraps=metadata.entry_points) as mock_entry_points:
+
+            ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
+            self.assertTrue('xml' in ploader.plugins.parser)
+            self.assertEqual(mock_entry_points.call_count, 1)
+
+            ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
+            self.assertTrue('xml' in ploader.plugins.parser)
+            self.assertEqual(mock_entry_points.call_count, 1)
+
+            # Distributions are only scanned once for all groups
+            self.assertEqual(loader._cached_entry_points('pluginlib.test.other'), ())
+            self.assertEqual(mock_entry_points.call_count, 1)
+
+            epoints = loader._ENTRY_POINTS['pluginlib.test.plugins']
+            self.assertEqual([epoint.name for epoint in epoints], ['parsers'])
+
+            # Distributions are scanned again after clearing the cache
+            loader.PluginLoader.clear_entry_point_cache()
+            self.assertEqual(loader._cached_entry_points('pluginlib.test.other'), ())
+            self.assertEqual(mock_entry_points.call_count, 2)
+
     def test_load_entry_points_bad(self):
         """Raise warning and continue when entry point fails - bad package"""
 
-        epoint1 = EntryPoint.parse('bad = not.a.real.module', dist=DIST)
-        epoint2 = EntryPoint.parse('parsers = tests.testdata.lib.parsers.xml', dist=DIST)
-        DIST._ep_map = {'pluginlib.test.plugins': {'bad': epoint1, 'parsers': epoint2}}
+        DIST.entry_points_txt = ('[pluginlib.test.plugins]\n'
+                                 'bad = not.a.real.module\n'
+                                 'parsers = tests.testdata.lib.parsers.xml\n')
 
         ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
 
         with warnings.catch_warnings(record=True) as e:
             warnings.simplefilter("always")
-            plugins = ploader.plugins
+            with mock.patch.object(loader, '_format_friendly') as mock_format_friendly:
+                plugins = ploader.plugins
 
             self.assertEqual(len(e), 1)
             self.assertTrue(issubclass(e[-1].category, EntryPointWarning))
             self.assertRegex(str(e[-1].message), 'can not be loaded for entry point bad')
 
+        # Traceback is not formatted since friendly output is not used
+        mock_format_friendly.assert_not_called()
+
         self.assertEqual(len(plugins.parser), 1)
         self.assertTrue('xml' in plugins.parser)
         self.assertEqual(len(plugins.engine), 0)
         self.assertEqual(len(plugins.hook), 0)
 
+        # Failed entry point is not imported again by other loaders, but still warns
+        ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
+
+        with warnings.catch_warnings(record=True) as e:
+            warnings.simplefilter("always")
+            with mock.patch.object(loader, '_import_module',
+                                   wraps=loader._import_module) as mock_import_module:
+                ploader.load_modules()
+
+            self.assertEqual(len(e), 1)
+            self.assertRegex(str(e[-1].message), 'can not be loaded for entry point bad')
+
+        self.assertEqual(mock_import_module.call_count, 1)
+        self.assertEqual(mock_import_module.call_args[0][0].name, 'parsers')
+
+    def test_load_entry_points_malformed(self):
+        """Raise warning and continue when entry point value is malformed"""
+
+        DIST.entry_points_txt = ('[pluginlib.test.plugins]\n'
+                                 'bad = -not-a-module-\n'
+                                 'parsers = tests.testdata.lib.parsers.xml\n')
+
+        ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
+
+        with warnings.catch_warnings(record=True) as e:
+            warnings.simplefilter("always")
+            plugins = ploader.plugins
+
+            self.assertEqual(len(e), 1)
+            self.assertTrue(issubclass(e[-1].category, EntryPointWarning))
+            self.assertRegex(str(e[-1].message), 'can not be loaded for entry point bad')
+
+        self.assertEqual(len(plugins.parser), 1)
+        self.assertTrue('xml' in plugins.parser)
+
     def test_load_entry_points_bad2(self):
         """Raise warning and continue when entry point fails - bad module"""
 
-        epoint1 = EntryPoint.parse('bad = tests.testdata.lib.parsers.bad', dist=DIST)
-        epoint2 = EntryPoint.parse('parsers = tests.testdata.lib.parsers.xml', dist=DIST)
-        DIST._ep_map = {'pluginlib.test.plugins': {'bad': epoint1, 'parsers': epoint2}}
+        DIST.entry_points_txt = ('[pluginlib.test.plugins]\n'
+                                 'bad = tests.testdata.lib.parsers.bad\n'
+                                 'parsers = tests.testdata.lib.parsers.xml\n')
 
         ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
 
@@ -230,8 +368,8 @@ class TestPluginLoader(TestCase):
     def test_load_entry_points_not_mod(self):
         """Raise warning and continue when entry point fails"""
 
-        epoint = EntryPoint.parse('parsers = tests.testdata.lib.parsers.xml:XML', dist=DIST)
-        DIST._ep_map = {'pluginlib.test.plugins': {'parsers': epoint}}
+        DIST.entry_points_txt = ('[pluginlib.test.plugins]\n'
+                                 'parsers = tests.testdata.lib.parsers.xml:XML\n')
 
         ploader = loader.PluginLoader(group='testdata', entry_point='pluginlib.test.plugins')
 
@@ -286,6 +424,15 @@ class TestPluginLoader(TestCase):
 
         self.assertEqual(plugins.engine.steam.__module__, 'pluginlib.importer.engines.steam')
 
+    def test_load_paths_trailing_sep(self):
+        """Trailing separators don't change module names"""
+
+        path = os.path.join(DATAPATH, 'lib', 'engines') + os.sep
+        ploader = loader.PluginLoader(group='testdata', paths=[path])
+        plugins = ploader.plugins
+
+        self.assertEqual(plugins.engine.steam.__module__, 'pluginlib.importer.engines.steam')
+
     def test_load_paths_bare(self):
         """Load modules from paths without init file"""
 
@@ -344,6 +491,23 @@ class TestPluginLoader(TestCase):
         self.assertTrue('engine' in plugins)
         self.assertFalse('hook' in plugins)
 
+    def test_load_debug(self):
+        """Module imports are only logged when debug logging is enabled"""
+
+        path = os.path.join(DATAPATH, 'lib', 'engines')
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib', paths=[path])
+
+        level = loader.LOGGER.level
+        loader.LOGGER.setLevel(logging.DEBUG)
+        try:
+            ploader.load_modules()
+        finally:
+            loader.LOGGER.setLevel(level)
+
+        output = OUTPUT.getvalue()
+        self.assertRegex(output, 'Attempting to load module tests.testdata.lib.parsers.json')
+        self.assertRegex(output, 'Attempting to load module pluginlib.importer.engines.steam')
+
     def test_load_paths_missing(self):
         """Log on invalid path"""
 
@@ -368,12 +532,11 @@ class TestPluginLoader(TestCase):
             ploader = loader.PluginLoader(group='testdata', paths=[path, path])
             plugins = ploader.plugins
 
-            self.assertEqual(len(e), 1)
-            self.assertTrue(issubclass(e[-1].category, PluginWarning))
-            self.assertRegex(str(e[-1].message), 'Duplicate plugins found')
+            self.assertEqual(len(e), 0)
 
         self.assertEqual(len(plugins.engine), 1)
         self.assertTrue('steam' in plugins.engine)
+        self.assertRegex(OUTPUT.getvalue().splitlines()[-1], 'Skipping duplicate plugin path')
 
     def test_bad_import(self):
         """Syntax error in imported module"""
@@ -387,6 +550,18 @@ class TestPluginLoader(TestCase):
         self.assertRegex(e.exception.friendly, 'tests.testdata.bad.syntax')
         self.assertRegex(e.exception.friendly, 'line 12')
 
+    def test_bad_import_recursive(self):
+        """Syntax error in module found while importing a package recursively"""
+
+        ploader = loader.PluginLoader(group='testdata', modules=['tests.testdata.bad'])
+        error = ('Error while importing candidate plugin module tests.testdata.bad.syntax from %s'
+                 % os.path.join(DATAPATH, 'bad'))
+        with self.assertRaisesRegex(PluginImportError, error) as e:
+            ploader.plugins  # pylint: disable=pointless-statement
+
+        self.assertRegex(e.exception.friendly, "SyntaxError: (?:invalid syntax|expected ':')")
+        self.assertRegex(e.exception.friendly, 'line 12')
+
     def test_bad_import2(self):
         """Exception raised by imported module"""
 
@@ -399,6 +574,16 @@ class TestPluginLoader(TestCase):
         self.assertRegex(e.exception.friendly, 'tests.testdata.bad2')
         self.assertRegex(e.exception.friendly, 'line 24')
 
+    def test_bad_import_missing(self):
+        """Module does not exist"""
+
+        ploader = loader.PluginLoader(group='testdata', modules=['tests.testdata.notreal'])
+        error = 'Error while importing candidate plugin module tests.testdata.notreal from None'
+        with self.assertRaisesRegex(PluginImportError, error) as e:
+            ploader.plugins  # pylint: disable=pointless-statement
+
+        self.assertRegex(e.exception.friendly, "No module named '?tests.testdata.notreal'?")
+
     def test_bad_import_path(self):
         """Syntax error in imported module loaded by path"""
 
@@ -416,8 +601,8 @@ class TestPluginLoader(TestCase):
         """plugins only loads modules on the first call"""
 
         ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
-        with mock.patch.object(ploader, 'load_modules',
-                               wraps=ploader.load_modules) as mock_load_modules:
+        with mock.patch.object(loader.PluginLoader, 'load_modules', autospec=True,
+                               side_effect=loader.PluginLoader.load_modules) as mock_load_modules:
             plugins1 = ploader.plugins
             self.assertEqual(mock_load_modules.call_count, 1)
 
@@ -429,14 +614,105 @@ class TestPluginLoader(TestCase):
             plugins2 = ploader.plugins
             self.assertEqual(mock_load_modules.call_count, 1)
 
+            # Cached results are copied
             self.assertEqual(plugins1, plugins2)
+            self.assertIsNot(plugins1, plugins2)
+            self.assertIsNot(plugins1.parser, plugins2.parser)
+
+    def test_plugins_cache_stale(self):
+        """Cached plugins are refreshed when new plugins are registered"""
+
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
+        plugins1 = ploader.plugins
+        self.assertFalse('yaml' in plugins1.parser)
+
+        class YAML(tests.testdata.parents.Parser):  # pylint: disable=unused-variable
+            """Dummy YAML parser"""
+
+            _alias_ = 'yaml'
+
+            def parse(self):
+                return 'yaml'
+
+        plugins2 = ploader.plugins
+        self.assertIsNot(plugins1, plugins2)
+        self.assertTrue('yaml' in plugins2.parser)
+        self.assertEqual(ploader.plugins, plugins2)
+
+    def test_plugins_cache_modified(self):
+        """Modifying returned plugins does not change cached results"""
+
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
+        plugins1 = ploader.plugins
+        del plugins1.parser['json']
+        plugins1.engine.clear()
+        del plugins1['hook']
+
+        plugins2 = ploader.plugins
+        self.assertTrue('json' in plugins2.parser)
+        self.assertTrue('steam' in plugins2.engine)
+        self.assertTrue('hook' in plugins2)
+
+    def test_plugins_cache_filters_changed(self):
+        """Cached plugins are refreshed when blacklist or type_filter are reassigned"""
+
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
+        self.assertTrue('json' in ploader.plugins.parser)
+        self.assertTrue('engine' in ploader.plugins)
+
+        ploader.blacklist = (BlacklistEntry('parser', 'json'),)
+        self.assertFalse('json' in ploader.plugins.parser)
+        self.assertEqual(ploader.get_plugin('parser', 'json'), None)
+
+        ploader.blacklist[0].name = 'xml'
+        self.assertTrue('json' in ploader.plugins.parser)
+        self.assertFalse('xml' in ploader.plugins.parser)
+
+        ploader.type_filter = ('parser',)
+        self.assertFalse('engine' in ploader.plugins)
+        self.assertTrue('json' in ploader.plugins.parser)
+
+        ploader.blacklist = ploader.type_filter = None
+        self.assertTrue('json' in ploader.plugins.parser)
+        self.assertTrue('engine' in ploader.plugins)
+
+    def test_plugins_cache_group_changed(self):
+        """Cached plugins are refreshed when group is reassigned"""
+
+        @Parent('widget', 'other')
+        class Widget(object):  # pylint: disable=unused-variable
+            """Widget parent class"""
+
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
+        self.assertTrue('parser' in ploader.plugins)
+
+        ploader.group = 'other'
+        self.assertEqual(list(ploader.plugins), ['widget'])
+        self.assertEqual(list(ploader.plugins_all), ['widget'])
+        self.assertIsNone(ploader.get_plugin('parser', 'json'))
+
+    def test_plugins_cache_removed(self):
+        """Cached plugins are refreshed when plugins are removed"""
+
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
+        jsonplugin = ploader.plugins.parser.json
+        self.assertEqual(jsonplugin.version, '2.0')
+
+        # Plugin is removed from the registry before the duplicate parent is rejected
+        with self.assertRaises(ValueError):
+            Parent('parser', 'testdata')(jsonplugin)
+        self.assertEqual(ploader.plugins.parser.json.version, '1.0')
+
+        loader.get_plugins()['testdata'].clear()
+        self.assertEqual(ploader.plugins, {})
+        self.assertIsNone(ploader.get_plugin('parser', 'xml'))
 
     def test_plugins_all(self):
         """plugins only loads modules on the first call"""
 
         ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
-        with mock.patch.object(ploader, 'load_modules',
-                               wraps=ploader.load_modules) as mock_load_modules:
+        with mock.patch.object(loader.PluginLoader, 'load_modules', autospec=True,
+                               side_effect=loader.PluginLoader.load_modules) as mock_load_modules:
             plugins1 = ploader.plugins_all
             self.assertEqual(mock_load_modules.call_count, 1)
 
@@ -469,8 +745,8 @@ class TestPluginLoader(TestCase):
         """Retrieve specific plugin"""
 
         ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
-        with mock.patch.object(ploader, 'load_modules',
-                               wraps=ploader.load_modules) as mock_load_modules:
+        with mock.patch.object(loader.PluginLoader, 'load_modules', autospec=True,
+                               side_effect=loader.PluginLoader.load_modules) as mock_load_modules:
 
             jsonplugin = ploader.get_plugin('parser', 'json')
             self.assertEqual(jsonplugin.name, 'json')
@@ -482,6 +758,23 @@ class TestPluginLoader(TestCase):
             self.assertEqual(jsonplugin.version, '1.0')
             self.assertEqual(mock_load_modules.call_count, 1)
 
+        with mock.patch.object(loader, 'get_plugins', wraps=loader.get_plugins) as mock_get_plugins:
+            self.assertIs(ploader.get_plugin('parser', 'json', '1.0'), jsonplugin)
+            self.assertEqual(mock_get_plugins.call_count, 0)
+
+    def test_get_plugin_cache_size(self):
+        """Cached results are discarded when the cache is full"""
+
+        ploader = loader.PluginLoader(group='testdata', library='tests.testdata.lib')
+
+        with mock.patch.object(loader, '_PLUGIN_CACHE_SIZE', 2):
+            self.assertEqual(ploader.get_plugin('parser', 'json').version, '2.0')
+            self.assertEqual(ploader.get_plugin('parser', 'json', '1.0').version, '1.0')
+            self.assertEqual(len(ploader._plugin_cache), 2)
+
+            self.assertEqual(ploader.get_plugin('parser', 'xml').name, 'xml')
+            self.assertEqual(len(ploader._plugin_cache), 1)
+
     def test_get_plugin_missing(self):
         """Attempt to retrieve non-existent plugin, return None"""
 
@@ -518,3 +811,134 @@ class TestPluginLoader(TestCase):
         jsonplugin = ploader.get_plugin('parser', 'json')
         self.assertEqual(jsonplugin.name, 'json')
         self.assertEqual(jsonplugin.version, '1.0')
+
+
+class TestIterModules(TestCase):
+    """Tests for _iter_modules"""
+
+    def test_iter_modules(self):
+        """Only modules and packages are returned, once each, in sorted order"""
+
+        missing = os.path.join(DATAPATH, 'NotARealPath')
+        modules = list(loader._iter_modules([missing, DATAPATH, DATAPATH], 'tests.testdata.'))
+
+        def path(*parts):
+            return os.path.join(DATAPATH, *parts)
+
+        self.assertEqual(modules, [
+            ('tests.testdata.bad', DATAPATH, True, path('bad', '__init__.py')),
+            ('tests.testdata.bad2', DATAPATH, False, path('bad2.py')),
+            ('tests.testdata.importer', DATAPATH, True, path('importer', '__init__.py')),
+            ('tests.testdata.lib', DATAPATH, True, path('lib', '__init__.py')),
+            ('tests.testdata.parents', DATAPATH, False, path('parents.py'))
+        ])
+
+    def test_iter_modules_skip(self):
+        """Files and directories that can't be imported as modules are skipped"""
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+
+        for dirname in ('package', 'bare', 'not.package'):
+            os.mkdir(os.path.join(tempdir, dirname))
+        for filename in ('module.py', 'notes.txt', 'README', 'not.module.py', '__init__.py',
+                         os.path.join('package', '__init__.py'),
+                         os.path.join('not.package', '__init__.py')):
+            # pylint: disable-next=consider-using-with
+            io.open(os.path.join(tempdir, filename), 'w', encoding='utf-8').close()
+
+        self.assertEqual(list(loader._iter_modules([tempdir], 'prefix.')),
+                         [('prefix.module', tempdir, False, os.path.join(tempdir, 'module.py')),
+                          ('prefix.package', tempdir, True,
+                           os.path.join(tempdir, 'package', '__init__.py'))])
+
+    def test_package_modules_cached(self):
+        """Package listings are reused until a directory is modified"""
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        missing = os.path.join(tempdir, 'NotARealPath')
+        # pylint: disable-next=consider-using-with
+        io.open(os.path.join(tempdir, 'first.py'), 'w', encoding='utf-8').close()
+
+        first = ('prefix.first', tempdir, False, os.path.join(tempdir, 'first.py'))
+        modules = loader._package_modules([tempdir, missing], 'prefix.')
+        self.assertEqual(modules, (first,))
+        self.assertIs(loader._package_modules([tempdir, missing], 'prefix.'), modules)
+
+        # pylint: disable-next=consider-using-with
+        io.open(os.path.join(tempdir, 'second.py'), 'w', encoding='utf-8').close()
+        mtime = os.stat(tempdir).st_mtime + 10
+        os.utime(tempdir, (mtime, mtime))
+
+        second = ('prefix.second', tempdir, False, os.path.join(tempdir, 'second.py'))
+        self.assertEqual(loader._package_modules([tempdir, missing], 'prefix.'), (first, second))
+
+    def test_package_modules_cached_subdir(self):
+        """Package listings are refreshed when a subdirectory becomes a package"""
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        subdir = os.path.join(tempdir, 'sub')
+        os.mkdir(subdir)
+
+        modules = loader._package_modules([tempdir], 'prefix.')
+        self.assertEqual(modules, ())
+        self.assertIs(loader._package_modules([tempdir], 'prefix.'), modules)
+
+        # Only the subdirectory is modified
+        mtime = os.stat(tempdir).st_mtime
+        # pylint: disable-next=consider-using-with
+        io.open(os.path.join(subdir, '__init__.py'), 'w', encoding='utf-8').close()
+        os.utime(tempdir, (mtime, mtime))
+        os.utime(subdir, (mtime + 10, mtime + 10))
+
+        self.assertEqual(loader._package_modules([tempdir], 'prefix.'),
+                         (('prefix.sub', tempdir, True, os.path.join(subdir, '__init__.py')),))
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'Requires symbolic links')
+    def test_iter_modules_symlink_loop(self):
+        """Symbolic links to directories are not walked"""
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        basename = os.path.basename(tempdir)
+        self.addCleanup(unload, 'pluginlib.importer.%s' % basename)
+
+        os.mkdir(os.path.join(tempdir, 'sub'))
+        # pylint: disable-next=consider-using-with
+        io.open(os.path.join(tempdir, 'sub', 'mod.py'), 'w', encoding='utf-8').close()
+        os.symlink(tempdir, os.path.join(tempdir, 'sub', 'loop'))
+
+        subdirs = []
+        self.assertEqual(list(loader._iter_modules([tempdir], 'prefix.', subdirs)), [])
+        self.assertEqual(subdirs, ['sub'])
+
+        subdirs = []
+        sub = os.path.join(tempdir, 'sub')
+        self.assertEqual(list(loader._iter_modules([sub], 'prefix.', subdirs)),
+                         [('prefix.mod', sub, False, os.path.join(sub, 'mod.py'))])
+        self.assertEqual(subdirs, [])
+
+        # Module is only imported once
+        loader._recursive_path_import(tempdir, 'pluginlib.importer')
+        self.assertEqual([mod for mod in sys.modules if basename in mod],
+                         ['pluginlib.importer.%s.sub.mod' % basename])
+
+    def test_iter_modules_error(self):
+        """Directories that can't be read are skipped"""
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        os.mkdir(os.path.join(tempdir, 'unreadable'))
+        real_scandir = loader.scandir
+
+        def scandir(path):
+            if path.endswith('unreadable'):
+                raise OSError('Permission denied')
+            return real_scandir(path)
+
+        subdirs = []
+        with mock.patch.object(loader, 'scandir', side_effect=scandir):
+            self.assertEqual(list(loader._iter_modules([tempdir], 'prefix.', subdirs)), [])
+        self.assertEqual(subdirs, [])
@@ -1,4 +1,4 @@
-# Copyright 2014 - 2023 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -247,6 +247,16 @@ class TestTypeDict(TestCase):
 
         self.assertIsNone(self.tdict._filter(name='pengion'))
 
+    def test_name_blacklisted_or_empty(self):
+        """Blacklisted or empty names return None"""
+        blacklist = [objects.BlacklistEntry(None, 'json')]
+        self.assertIsNone(self.tdict._filter(blacklist, name='json'))
+        self.mock_plugin_json._filter.assert_not_called()
+
+        self.mock_plugin_xml._filter.return_value = None
+        self.assertIsNone(self.tdict._filter(blacklist, name='xml'))
+        self.mock_plugin_xml._filter.assert_called_with([], newest_only=False, name='xml')
+
 
 class TestPluginDict(TestCase):
     """Tests for PluginDict dictionary subclass"""
@@ -275,6 +285,48 @@ class TestPluginDict(TestCase):
         self.assertTrue('sorted_keys' in self.udict._cache)
         self.assertEqual(self.udict._cache['sorted_keys'], ['1.0', '3.0'])
 
+    def test_parsed_keys(self):
+        """Parses each key once and populates cache"""
+
+        parsed_keys = self.udict._parsed_keys()
+        self.assertEqual(sorted(key for key, _ in parsed_keys), ['1.0', '2.0', '3.0'])
+        for key, parsed in parsed_keys:
+            self.assertEqual(parsed, objects.parse_version(key))
+        self.assertIs(self.udict._parsed_keys(), parsed_keys)
+
+        del self.udict['2.0']
+        self.assertFalse('parsed_keys' in self.udict._cache)
+        self.assertEqual(sorted(key for key, _ in self.udict._parsed_keys()), ['1.0', '3.0'])
+
+    def test_newest_key(self):
+        """Finds newest without sorting and populates cache"""
+
+        self.assertEqual(self.udict._newest_key(), '3.0')
+        self.assertEqual(self.udict._cache['newest_key'], '3.0')
+        self.assertFalse('sorted_keys' in self.udict._cache)
+
+        # Call again to make sure results are consistent
+        self.assertEqual(self.udict._newest_key(), '3.0')
+
+        # Sorted keys are used when already cached
+        self.udict['10.0'] = 'diez'
+        self.assertFalse('newest_key' in self.udict._cache)
+        self.udict._cache['sorted_keys'] = ['1.0', '2.0', '3.0', '10.0']
+        self.assertEqual(self.udict._newest_key(), '10.0')
+        self.assertEqual(self.udict._cache['newest_key'], '10.0')
+
+    def test_newest_key_equal_versions(self):
+        """Newest of equal versions is the same whether or not keys are sorted"""
+
+        udict = objects.PluginDict([('1.0', 'uno'), ('1.0.0', 'uno punto cero'), ('0.9', 'nueve')])
+        newest = udict._newest_key()
+        self.assertEqual(newest, sorted(udict, key=objects.parse_version)[-1])
+
+        del udict['0.9']
+        self.assertEqual(udict._sorted_keys()[-1], newest)
+        self.assertEqual(udict._newest_key(), newest)
+        self.assertEqual(list(udict._filter())[-1], newest)
+
     def test_empty(self):
         """Empty dictionary will return None"""
         udict = objects.PluginDict()
@@ -341,3 +393,26 @@ class TestPluginDict(TestCase):
         blacklist = [objects.BlacklistEntry(None, None, '1.0')]
         self.assertEqual(self.udict._filter(blacklist, newest_only=True, version='1.0'), None)
         self.assertEqual(self.udict._filter(blacklist, newest_only=True, version='2.0'), 'dos')
+
+
+class TestParseVersion(TestCase):
+    """Tests for parse_version"""
+
+    def test_cached(self):
+        """Parsed versions are reused until the cache is full"""
+
+        with mock.patch.object(objects, '_VERSIONS', {}) as versions:
+            with mock.patch.object(objects, '_VERSIONS_SIZE', 2):
+                parsed = objects.parse_version('1.0')
+                self.assertIs(objects.parse_version('1.0'), parsed)
+                self.assertTrue(objects.parse_version('2.0') > parsed)
+                self.assertEqual(len(versions), 2)
+
+                objects.parse_version('3.0')
+                self.assertEqual(list(versions), ['3.0'])
+
+    def test_invalid(self):
+        """Versions that don't conform to PEP 440 are treated as 0"""
+
+        self.assertEqual(objects.parse_version('not.a.version'), objects.parse_version('0'))
+        self.assertTrue(objects.parse_version('0.1') > objects.parse_version('not.a.version'))
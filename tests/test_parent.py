@@ -1,4 +1,4 @@
-# Copyright 2014 - 2023 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -305,6 +305,20 @@ class TestPluginType(TestCase):
         # Clear plugins from module
         parent.get_plugins().clear()
 
+    def test_inspector_slots(self):
+        """ClassInspector instances don't have an instance dictionary"""
+
+        @parent.Parent('test_parent')
+        class Parent(object):
+            """Parent"""
+
+        class Child(Parent):
+            """Child"""
+
+        result = parent.ClassInspector(Parent, Child)
+        self.assertTrue(result)
+        self.assertFalse(hasattr(result, '__dict__'))
+
     def test_skipload_static(self):
         """Use _skipload_ static method to determine if plugin should be used"""
 
@@ -427,6 +441,11 @@ class TestPluginType(TestCase):
 
         self.meth(Parent, 'Argument spec does not match parent for method')
 
+        # Argument spec for abstract method is cached
+        method = Parent.__abstractmethods__['abstract']
+        self.assertIn(method, parent._ARGSPECS)
+        self.assertIs(parent._abstract_argspec(method), parent._ARGSPECS[method])
+
     def test_abstract_staticmethod(self):
         """Static method required in subclass"""
 
@@ -1,4 +1,4 @@
-# Copyright 2014 - 2022 Avram Lubkin, All Rights Reserved
+# Copyright 2014 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -185,13 +185,15 @@ class TestDictWithDotNotation(TestCase):
 
     def test_getter(self):
         """Values can be retrieved by index or dot notation"""
-        dotdict = util.DictWithDotNotation({'hello': 'world'})
+        dotdict = util.DictWithDotNotation({'hello': 'world', 'empty': None})
 
         self.assertEqual('world', dotdict['hello'])
         self.assertEqual('world', dotdict.hello)
+        self.assertIsNone(dotdict.empty)
 
-        with self.assertRaises(AttributeError):
+        with self.assertRaises(AttributeError) as e:
             dotdict.notInDict  # pylint: disable=pointless-statement
+        self.assertIsNone(getattr(e.exception, '__context__', None))
 
         with self.assertRaises(KeyError):
             dotdict['notInDict']  # pylint: disable=pointless-statement